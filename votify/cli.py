@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -32,6 +34,8 @@ from .enums import (
     RemuxModeVideo,
     VideoFormat,
 )
+from .metadata_cache import MetadataCache
+from .models import DownloadQueueItem
 from .spotify_api import SpotifyApi
 
 logger = logging.getLogger("votify")
@@ -41,6 +45,7 @@ downloader_sig = inspect.signature(Downloader.__init__)
 downloader_audio_sig = inspect.signature(DownloaderAudio.__init__)
 downloader_song_sig = inspect.signature(DownloaderSong.__init__)
 downloader_video_sig = inspect.signature(DownloaderVideo.__init__)
+metadata_cache_sig = inspect.signature(MetadataCache.__init__)
 
 
 def get_param_string(param: click.Parameter) -> str:
@@ -82,6 +87,87 @@ def load_config_file(
     return ctx
 
 
+def download_media(
+    download_queue_item: DownloadQueueItem,
+    playlist_track: int,
+    queue_progress: str,
+    downloader: Downloader,
+    downloader_song: DownloaderSong,
+    downloader_episode: DownloaderEpisode,
+    downloader_episode_video: DownloaderEpisodeVideo,
+    downloader_music_video: DownloaderMusicVideo,
+    audio_quality: AudioQuality,
+    enable_videos: bool,
+    can_download_music_videos: bool,
+    download_music_videos: bool,
+    download_podcast_videos: bool,
+    no_exceptions: bool,
+) -> bool:
+    media_metadata = download_queue_item.media_metadata
+    try:
+        logger.info(f'({queue_progress}) Downloading "{media_metadata["name"]}"')
+        media_id = downloader.get_media_id(media_metadata)
+        media_type = media_metadata["type"]
+        gid_metadata = downloader.get_gid_metadata(media_id, media_type)
+        if gid_metadata.get("original_video") or (
+            media_type == "track" and download_music_videos
+        ):
+            if not enable_videos or not can_download_music_videos:
+                logger.warning(
+                    "Music videos are not downloadable with current "
+                    "configuration, skipping"
+                )
+                return True
+            downloader_music_video.download(
+                music_video_id=media_id,
+                music_video_metadata=media_metadata,
+                album_metadata=download_queue_item.album_metadata,
+                gid_metadata=gid_metadata,
+                playlist_metadata=download_queue_item.playlist_metadata,
+                playlist_track=playlist_track,
+            )
+        elif media_type == "track":
+            if audio_quality in VORBIS_AUDIO_QUALITIES:
+                logger.warning(
+                    "Vorbis audio quality is only supported for podcasts, skipping"
+                )
+                return True
+            downloader_song.download(
+                track_id=media_id,
+                track_metadata=media_metadata,
+                album_metadata=download_queue_item.album_metadata,
+                gid_metadata=gid_metadata,
+                playlist_metadata=download_queue_item.playlist_metadata,
+                playlist_track=playlist_track,
+            )
+        elif media_type == "episode":
+            if enable_videos and download_podcast_videos:
+                downloader_episode_video.download(
+                    episode_id=media_id,
+                    episode_metadata=media_metadata,
+                    show_metadata=download_queue_item.show_metadata,
+                    gid_metadata=gid_metadata,
+                    playlist_metadata=download_queue_item.playlist_metadata,
+                    playlist_track=playlist_track,
+                )
+            else:
+                downloader_episode.download(
+                    episode_id=media_id,
+                    episode_metadata=media_metadata,
+                    show_metadata=download_queue_item.show_metadata,
+                    gid_metadata=gid_metadata,
+                    playlist_metadata=download_queue_item.playlist_metadata,
+                    playlist_track=playlist_track,
+                )
+    except Exception as e:
+        logger.error(
+            f'({queue_progress}) Failed to download "{media_metadata["name"]}"',
+            exc_info=not no_exceptions,
+        )
+        return False
+    return True
+
+
 @click.command()
 @click.help_option("-h", "--help")
 @click.version_option(__version__, "-v", "--version")
@@ -99,6 +185,12 @@ def load_config_file(
     default=5,
     help="Wait interval between downloads in seconds.",
 )
+@click.option(
+    "--download-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of tracks to download at the same time.",
+)
 @click.option(
     "--enable-videos",
     is_flag=True,
@@ -149,6 +241,18 @@ def load_config_file(
     default=Path("./cookies.txt"),
     help="Path to cookies file.",
 )
+@click.option(
+    "--metadata-cache-path",
+    type=Path,
+    default=Path.home() / ".votify" / "metadata.db",
+    help="Path to metadata cache file.",
+)
+@click.option(
+    "--metadata-cache-ttl",
+    type=int,
+    default=metadata_cache_sig.parameters["ttl"].default,
+    help="Metadata cache lifetime in seconds (0 disables the cache).",
+)
 # Downloader specific options
 @click.option(
     "--output-path",
@@ -305,7 +409,7 @@ def load_config_file(
     "-d",
     type=DownloadMode,
     default=downloader_audio_sig.parameters["download_mode"].default,
-    help="Download mode for songs and podcasts.",
+    help="Download mode.",
 )
 @click.option(
     "--remux-mode-audio",
@@ -349,6 +453,7 @@ def load_config_file(
 def main(
     urls: list[str],
     wait_interval: float,
+    download_workers: int,
     enable_videos: bool,
     download_music_videos: bool,
     download_podcast_videos: bool,
@@ -358,6 +463,8 @@ def main(
     log_level: str,
     no_exceptions: bool,
     cookies_path: Path,
+    metadata_cache_path: Path,
+    metadata_cache_ttl: int,
     output_path: Path,
     temp_path: Path,
     wvd_path: Path,
@@ -406,6 +513,11 @@ def main(
             "Failed to get a valid session. Try logging in and exporting your cookies again"
         )
         return
+    metadata_cache = (
+        MetadataCache(metadata_cache_path, metadata_cache_ttl)
+        if metadata_cache_ttl > 0
+        else None
+    )
     downloader = Downloader(
         spotify_api,
         output_path,
@@ -432,6 +544,7 @@ def main(
         overwrite,
         exclude_tags,
         truncate,
+        metadata_cache=metadata_cache,
     )
     downloader_audio = DownloaderAudio(
         downloader,
@@ -451,6 +564,7 @@ def main(
         downloader,
         video_format,
         remux_mode_video,
+        download_mode,
     )
     downloader_episode_video = DownloaderEpisodeVideo(
         downloader_video,
@@ -517,6 +631,12 @@ def main(
         ):
             logger.critical(X_NOT_FOUND_STRING.format("MP4Box", mp4box_path))
             return
+        if (
+            downloader_music_video.download_mode == DownloadMode.ARIA2C
+            and not downloader.aria2c_path_full
+        ):
+            logger.critical(X_NOT_FOUND_STRING.format("aria2c", aria2c_path))
+            return
         music_video_warning_message = []
         if not downloader.mp4decrypt_path_full and video_format == VideoFormat.MP4:
             music_video_warning_message.append(
@@ -543,104 +663,86 @@ def main(
             )
             can_download_music_videos = False
     error_count = 0
+    download = functools.partial(
+        download_media,
+        downloader=downloader,
+        downloader_song=downloader_song,
+        downloader_episode=downloader_episode,
+        downloader_episode_video=downloader_episode_video,
+        downloader_music_video=downloader_music_video,
+        audio_quality=audio_quality,
+        enable_videos=enable_videos,
+        can_download_music_videos=can_download_music_videos,
+        download_music_videos=download_music_videos,
+        download_podcast_videos=download_podcast_videos,
+        no_exceptions=no_exceptions,
+    )
     if read_urls_as_txt:
         _urls = []
         for url in urls:
             if Path(url).exists():
                 _urls.extend(Path(url).read_text(encoding="utf-8").splitlines())
         urls = _urls
-    for url_index, url in enumerate(urls, start=1):
-        url_progress = f"URL {url_index}/{len(urls)}"
-        logger.info(f'({url_progress}) Checking "{url}"')
+    try:
         try:
-            url_info = downloader.get_url_info(url)
-            if url_info.type == "artist":
-                download_queue = downloader.get_download_queue_from_artist(url_info.id)
-            else:
-                download_queue = downloader.get_download_queue(
-                    url_info.type,
-                    url_info.id,
-                )
-        except Exception as e:
-            error_count += 1
-            logger.error(
-                f'({url_progress}) Failed to check "{url}"',
-                exc_info=no_exceptions,
-            )
-            continue
-        for index, download_queue_item in enumerate(download_queue, start=1):
-            queue_progress = (
-                f"Track {index}/{len(download_queue)} from URL {url_index}/{len(urls)}"
-            )
-            media_metadata = download_queue_item.media_metadata
+            downloader.prefetch_urls(urls)
+        except Exception:
+            logger.debug("Failed to prefetch metadata", exc_info=True)
+        for url_index, url in enumerate(urls, start=1):
+            url_progress = f"URL {url_index}/{len(urls)}"
+            logger.info(f'({url_progress}) Checking "{url}"')
             try:
-                logger.info(
-                    f'({queue_progress}) Downloading "{media_metadata["name"]}"'
-                )
-                media_id = downloader.get_media_id(media_metadata)
-                media_type = media_metadata["type"]
-                gid_metadata = downloader.get_gid_metadata(media_id, media_type)
-                if gid_metadata.get("original_video") or (
-                    media_type == "track" and download_music_videos
-                ):
-                    if not enable_videos or not can_download_music_videos:
-                        logger.warning(
-                            "Music videos are not downloadable with current "
-                            "configuration, skipping"
-                        )
-                        continue
-                    downloader_music_video.download(
-                        music_video_id=media_id,
-                        music_video_metadata=media_metadata,
-                        album_metadata=download_queue_item.album_metadata,
-                        gid_metadata=gid_metadata,
-                        playlist_metadata=download_queue_item.playlist_metadata,
-                        playlist_track=index,
+                url_info = downloader.get_url_info(url)
+                if url_info.type == "artist":
+                    download_queue = downloader.get_download_queue_from_artist(
+                        url_info.id
                     )
-                elif media_type == "track":
-                    if audio_quality in VORBIS_AUDIO_QUALITIES:
-                        logger.warning(
-                            "Vorbis audio quality is only supported for podcasts, "
-                            "skipping"
-                        )
-                        continue
-                    downloader_song.download(
-                        track_id=media_id,
-                        track_metadata=media_metadata,
-                        album_metadata=download_queue_item.album_metadata,
-                        gid_metadata=gid_metadata,
-                        playlist_metadata=download_queue_item.playlist_metadata,
-                        playlist_track=index,
+                else:
+                    download_queue = downloader.get_download_queue(
+                        url_info.type,
+                        url_info.id,
                     )
-                elif media_type == "episode":
-                    if enable_videos and download_podcast_videos:
-                        downloader_episode_video.download(
-                            episode_id=media_id,
-                            episode_metadata=media_metadata,
-                            show_metadata=download_queue_item.show_metadata,
-                            gid_metadata=gid_metadata,
-                            playlist_metadata=download_queue_item.playlist_metadata,
-                            playlist_track=index,
-                        )
-                    else:
-                        downloader_episode.download(
-                            episode_id=media_id,
-                            episode_metadata=media_metadata,
-                            show_metadata=download_queue_item.show_metadata,
-                            gid_metadata=gid_metadata,
-                            playlist_metadata=download_queue_item.playlist_metadata,
-                            playlist_track=index,
-                        )
             except Exception as e:
                 error_count += 1
                 logger.error(
-                    f'({queue_progress}) Failed to download "{media_metadata["name"]}"',
-                    exc_info=not no_exceptions,
+                    f'({url_progress}) Failed to check "{url}"',
+                    exc_info=no_exceptions,
                 )
+                continue
+
+            executor = (
+                ThreadPoolExecutor(max_workers=download_workers)
+                if download_workers > 1
+                else None
+            )
+            futures = []
+            try:
+                for index, download_queue_item in enumerate(download_queue, start=1):
+                    queue_progress = f"Track {index}/{len(download_queue)} from URL {url_index}/{len(urls)}"
+                    if executor is None:
+                        error_count += not download(
+                            download_queue_item, index, queue_progress
+                        )
+                    else:
+                        futures.append(
+                            executor.submit(
+                                download, download_queue_item, index, queue_progress
+                            )
+                        )
+                    if wait_interval > 0 and index != len(download_queue):
+                        logger.debug(
+                            "Waiting for %s second(s) before continuing", wait_interval
+                        )
+                        time.sleep(wait_interval)
+                error_count += sum(not future.result() for future in futures)
             finally:
-                if wait_interval > 0 and index != len(download_queue):
-                    logger.debug(
-                        f"Waiting for {wait_interval} second(s) before continuing"
-                    )
-                    time.sleep(wait_interval)
-        logger.info(f"Done ({error_count} error(s))")
+                if executor is not None:
+                    # shutdown(cancel_futures=True) needs Python 3.9
+                    for future in futures:
+                        future.cancel()
+                    executor.shutdown(wait=False)
+            logger.info(f"Done ({error_count} error(s))")
+    finally:
+        if metadata_cache is not None:
+            metadata_cache.close()
+    downloader.cleanup_temp_path()
@@ -92,3 +92,5 @@ COVER_SIZE_X_KEY_MAPPING_VIDEO = {
     CoverSize.LARGE: "ab6742d3000053b7",
     CoverSize.EXTRA_LARGE: "ab6742d3000053b7",
 }
+
+YTDLP_BUFFER_SIZE = 1 << 20
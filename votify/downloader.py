@@ -4,9 +4,13 @@ import base64
 import datetime
 import functools
 import logging
+import os
 import re
 import shutil
 import subprocess
+import threading
+import typing
+from collections import OrderedDict
 from io import BytesIO
 from pathlib import Path
 
@@ -25,13 +29,31 @@ from .constants import (
     VORBIS_TAGS_MAPPING,
 )
 from .enums import CoverSize
-from .models import DownloadQueueItem, UrlInfo
+from .metadata_cache import MetadataCache
+from .models import AlbumIndex, DownloadQueueItem, UrlInfo
 from .spotify_api import SpotifyApi
 from .utils import check_response
 
 logger = logging.getLogger("votify")
 
 
+@functools.lru_cache()
+def _get_response_bytes(session: requests.Session, url: str) -> bytes:
+    response = session.get(url)
+    check_response(response)
+    return response.content
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_release_date(release_date: str, date_format: str) -> datetime.datetime:
+    return datetime.datetime.strptime(release_date, date_format)
+
+
+@functools.lru_cache(maxsize=512)
+def _format_release_date(datetime_obj: datetime.datetime, date_format: str) -> str:
+    return datetime_obj.strftime(date_format)
+
+
 class Downloader:
     ILLEGAL_CHARACTERS_REGEX = r'[\\/:*?"<>|;]'
     URL_RE = r"(album|playlist|track|show|episode|artist)/(\w{22})"
@@ -41,6 +63,15 @@ class Downloader:
         "month": "%Y-%m",
         "day": "%Y-%m-%d",
     }
+    PERSISTENT_METADATA_TYPES = (
+        "track",
+        "album",
+        "episode",
+        "track_credits",
+        "lyrics",
+        "gid_metadata",
+    )
+    MAX_METADATA_CACHE_SIZE = 256
 
     def __init__(
         self,
@@ -71,6 +102,7 @@ class Downloader:
         truncate: int = None,
         silence: bool = False,
         skip_cleanup: bool = False,
+        metadata_cache: MetadataCache = None,
     ):
         self.spotify_api = spotify_api
         self.output_path = output_path
@@ -99,11 +131,50 @@ class Downloader:
         self.truncate = truncate
         self.silence = silence
         self.skip_cleanup = skip_cleanup
+        self.metadata_cache = metadata_cache
+        self._set_metadata_caches()
+        self._set_playlist_file_lock()
+        self._set_media_locks()
+        self._set_file_locks()
+        self._set_prompt_lock()
         self._set_binaries_full_path()
         self._set_exclude_tags_list()
         self._set_truncate()
         self._set_subprocess_additional_args()
 
+    def _set_metadata_caches(self):
+        self._metadata_cache = OrderedDict()
+        self._metadata_cache_events = {}
+        self._metadata_cache_lock = threading.Lock()
+        self._album_index_cache = OrderedDict()
+        self._album_copyrights_cache = OrderedDict()
+        self._show_episode_numbers_cache = OrderedDict()
+
+    def _set_bounded_cache_item(
+        self,
+        cache: OrderedDict,
+        key: typing.Hashable,
+        value: typing.Any,
+    ):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.MAX_METADATA_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _set_playlist_file_lock(self):
+        self._playlist_file_lock = threading.Lock()
+
+    def _set_media_locks(self):
+        self._media_locks = {}
+        self._media_locks_lock = threading.Lock()
+
+    def _set_file_locks(self):
+        self._file_locks = {}
+        self._file_locks_lock = threading.Lock()
+
+    def _set_prompt_lock(self):
+        self.prompt_lock = threading.Lock()
+
     def _set_binaries_full_path(self):
         self.aria2c_path_full = shutil.which(self.aria2c_path)
         self.ffmpeg_path_full = shutil.which(self.ffmpeg_path)
@@ -125,11 +196,14 @@ class Downloader:
     def _set_subprocess_additional_args(self):
         if self.silence:
             self.subprocess_additional_args = {
+                "stdin": subprocess.DEVNULL,
                 "stdout": subprocess.DEVNULL,
                 "stderr": subprocess.DEVNULL,
             }
         else:
-            self.subprocess_additional_args = {}
+            self.subprocess_additional_args = {
+                "stdin": subprocess.DEVNULL,
+            }
 
     def set_cdm(self) -> None:
         self.cdm = Cdm.from_device(Device.load(self.wvd_path))
@@ -147,7 +221,7 @@ class Downloader:
     ) -> list[DownloadQueueItem]:
         download_queue = []
         if media_type == "album":
-            album = self.spotify_api.get_album(media_id)
+            album = self.get_album(media_id)
             for track in album["tracks"]["items"]:
                 download_queue.append(
                     DownloadQueueItem(
@@ -157,6 +231,16 @@ class Downloader:
                 )
         elif media_type == "playlist":
             playlist = self.spotify_api.get_playlist(media_id)
+            try:
+                self.prefetch_albums(
+                    track["track"]["album"]["id"]
+                    for track in playlist["tracks"]["items"]
+                    if track["track"] is not None
+                    and track["track"]["type"] == "track"
+                    and track["track"]["album"].get("id")
+                )
+            except Exception:
+                logger.debug("Failed to prefetch albums", exc_info=True)
             for track in playlist["tracks"]["items"]:
                 if track["track"] is None:
                     continue
@@ -169,17 +253,17 @@ class Downloader:
         elif media_type == "track":
             download_queue.append(
                 DownloadQueueItem(
-                    media_metadata=self.spotify_api.get_track(media_id),
+                    media_metadata=self.get_track(media_id),
                 )
             )
         elif media_type == "episode":
             download_queue.append(
                 DownloadQueueItem(
-                    media_metadata=self.spotify_api.get_episode(media_id),
+                    media_metadata=self.get_episode(media_id),
                 )
             )
         elif media_type == "show":
-            show = self.spotify_api.get_show(media_id)
+            show = self.get_show(media_id)
             for episode in show["episodes"]["items"]:
                 download_queue.append(
                     DownloadQueueItem(
@@ -249,6 +333,10 @@ class Downloader:
             choices=choices,
             multiselect=True,
         ).execute()
+        try:
+            self.prefetch_albums(selected)
+        except Exception:
+            logger.debug("Failed to prefetch albums", exc_info=True)
         for album_id in selected:
             download_queue.extend(
                 self.get_download_queue(
@@ -264,16 +352,75 @@ class Downloader:
         return self._get_cover_url(metadata["images"], cover_size_mapping)
 
     def _get_cover_url(self, images_dict: list[dict], cover_size_mapping: dict) -> str:
-        original_cover_url = images_dict[0]["url"]
-        original_cover_id = original_cover_url.split("/")[-1]
+        cover_url_base, _, original_cover_id = images_dict[0]["url"].rpartition("/")
         cover_key = cover_size_mapping[self.cover_size]
         cover_id = cover_key + original_cover_id[len(cover_key) :]
-        cover_url = f"{original_cover_url.rpartition('/')[0]}/{cover_id}"
+        cover_url = f"{cover_url_base}/{cover_id}"
         return cover_url
 
     def get_media_id(self, media_metadata: dict) -> str:
         return (media_metadata.get("linked_from") or media_metadata)["id"]
 
+    def get_album_index(self, album_metadata: dict) -> AlbumIndex:
+        album_index = self._album_index_cache.get(album_metadata["id"])
+        if album_index is not None:
+            return album_index
+        get_media_id = self.get_media_id
+        tracks = {}
+        track_totals = {}
+        disc_total = 1
+        for track in album_metadata["tracks"]["items"]:
+            disc = track["disc_number"]
+            tracks[get_media_id(track)] = track
+            if track["track_number"] > track_totals.get(disc, 0):
+                track_totals[disc] = track["track_number"]
+            if disc > disc_total:
+                disc_total = disc
+        album_index = AlbumIndex(
+            tracks=tracks,
+            track_totals=track_totals,
+            disc_total=disc_total,
+            album_artist=self.get_artist_string(album_metadata["artists"]),
+        )
+        self._set_bounded_cache_item(
+            self._album_index_cache,
+            album_metadata["id"],
+            album_index,
+        )
+        return album_index
+
+    def get_album_copyrights(self, album_metadata: dict) -> dict[str, str]:
+        album_copyrights = self._album_copyrights_cache.get(album_metadata["id"])
+        if album_copyrights is not None:
+            return album_copyrights
+        album_copyrights = {}
+        for album_copyright in album_metadata.get("copyrights") or ():
+            album_copyrights.setdefault(
+                album_copyright["type"], album_copyright["text"]
+            )
+        self._set_bounded_cache_item(
+            self._album_copyrights_cache,
+            album_metadata["id"],
+            album_copyrights,
+        )
+        return album_copyrights
+
+    def get_show_episode_numbers(self, show_metadata: dict) -> dict[str, int]:
+        show_episode_numbers = self._show_episode_numbers_cache.get(show_metadata["id"])
+        if show_episode_numbers is not None:
+            return show_episode_numbers
+        episodes = show_metadata["episodes"]["items"]
+        show_episode_numbers = {
+            episode["id"]: len(episodes) - index
+            for index, episode in enumerate(episodes)
+        }
+        self._set_bounded_cache_item(
+            self._show_episode_numbers_cache,
+            show_metadata["id"],
+            show_episode_numbers,
+        )
+        return show_episode_numbers
+
     def get_playlist_tags(self, playlist_metadata: dict, playlist_track: int) -> dict:
         return {
             "playlist_artist": playlist_metadata["owner"]["display_name"],
@@ -352,18 +499,188 @@ class Downloader:
             ("../" * (playlist_file_path_parent_parts_len - output_path_parts_len)),
             *final_path.parts[output_path_parts_len:],
         )
-        playlist_file_lines = (
-            playlist_file_path.open("r", encoding="utf8").readlines()
-            if playlist_file_path.exists()
-            else []
-        )
-        if len(playlist_file_lines) < playlist_track:
-            playlist_file_lines.extend(
-                "\n" for _ in range(playlist_track - len(playlist_file_lines))
+        with self._playlist_file_lock:
+            playlist_file_lines = (
+                playlist_file_path.open("r", encoding="utf8").readlines()
+                if playlist_file_path.exists()
+                else []
             )
-        playlist_file_lines[playlist_track - 1] = final_path_relative.as_posix() + "\n"
-        with playlist_file_path.open("w", encoding="utf8") as playlist_file:
-            playlist_file.writelines(playlist_file_lines)
+            if len(playlist_file_lines) < playlist_track:
+                playlist_file_lines.extend(
+                    "\n" for _ in range(playlist_track - len(playlist_file_lines))
+                )
+            playlist_file_lines[playlist_track - 1] = (
+                final_path_relative.as_posix() + "\n"
+            )
+            with playlist_file_path.open("w", encoding="utf8") as playlist_file:
+                playlist_file.writelines(playlist_file_lines)
+
+    def _get_cached(
+        self,
+        key: tuple,
+        getter: typing.Callable,
+        *args,
+    ) -> typing.Any:
+        while True:
+            with self._metadata_cache_lock:
+                if key in self._metadata_cache:
+                    self._metadata_cache.move_to_end(key)
+                    return self._metadata_cache[key]
+                event = self._metadata_cache_events.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._metadata_cache_events[key] = event
+                    break
+            event.wait()
+        try:
+            result = self._get_persistent_cached(key, getter, *args)
+            with self._metadata_cache_lock:
+                self._set_bounded_cache_item(self._metadata_cache, key, result)
+            return result
+        finally:
+            with self._metadata_cache_lock:
+                del self._metadata_cache_events[key]
+            event.set()
+
+    def _get_persistent_cached(
+        self,
+        key: tuple,
+        getter: typing.Callable,
+        *args,
+    ) -> typing.Any:
+        if self.metadata_cache is None or key[0] not in self.PERSISTENT_METADATA_TYPES:
+            return getter(*args)
+        result = self.metadata_cache.get(key)
+        if result is None:
+            result = getter(*args)
+            if result is not None:
+                self.metadata_cache.set(key, result)
+        return result
+
+    def get_track(self, track_id: str) -> dict:
+        return self._get_cached(
+            ("track", track_id),
+            self.spotify_api.get_track,
+            track_id,
+        )
+
+    def get_album(self, album_id: str) -> dict:
+        return self._get_cached(
+            ("album", album_id),
+            self.spotify_api.get_album,
+            album_id,
+        )
+
+    def _prefetch(
+        self,
+        media_type: str,
+        media_ids: typing.Iterable[str],
+        getter: typing.Callable[[list[str]], list[dict]],
+        max_per_request: int,
+    ):
+        with self._metadata_cache_lock:
+            media_ids = [
+                media_id
+                for media_id in dict.fromkeys(media_ids)
+                if (media_type, media_id) not in self._metadata_cache
+            ][: self.MAX_METADATA_CACHE_SIZE]
+        persistent = (
+            self.metadata_cache is not None
+            and media_type in self.PERSISTENT_METADATA_TYPES
+        )
+        if persistent:
+            media_ids_not_cached = []
+            for media_id in media_ids:
+                media = self.metadata_cache.get((media_type, media_id))
+                if media is None:
+                    media_ids_not_cached.append(media_id)
+                    continue
+                with self._metadata_cache_lock:
+                    self._set_bounded_cache_item(
+                        self._metadata_cache,
+                        (media_type, media_id),
+                        media,
+                    )
+            media_ids = media_ids_not_cached
+        for index in range(0, len(media_ids), max_per_request):
+            medias = getter(media_ids[index : index + max_per_request])
+            with self._metadata_cache_lock:
+                for media in medias:
+                    self._set_bounded_cache_item(
+                        self._metadata_cache,
+                        (media_type, media["id"]),
+                        media,
+                    )
+            if persistent:
+                for media in medias:
+                    self.metadata_cache.set((media_type, media["id"]), media)
+
+    def prefetch_albums(self, album_ids: typing.Iterable[str]):
+        self._prefetch(
+            "album",
+            album_ids,
+            self.spotify_api.get_albums,
+            self.spotify_api.MAX_ALBUMS_PER_REQUEST,
+        )
+
+    def prefetch_tracks(self, track_ids: typing.Iterable[str]):
+        self._prefetch(
+            "track",
+            track_ids,
+            self.spotify_api.get_tracks,
+            self.spotify_api.MAX_TRACKS_PER_REQUEST,
+        )
+
+    def prefetch_episodes(self, episode_ids: typing.Iterable[str]):
+        self._prefetch(
+            "episode",
+            episode_ids,
+            self.spotify_api.get_episodes,
+            self.spotify_api.MAX_EPISODES_PER_REQUEST,
+        )
+
+    def prefetch_urls(self, urls: typing.Iterable[str]):
+        track_ids = []
+        episode_ids = []
+        for url in urls:
+            try:
+                url_info = self.get_url_info(url)
+            except Exception:
+                continue
+            if url_info.type == "track":
+                track_ids.append(url_info.id)
+            elif url_info.type == "episode":
+                episode_ids.append(url_info.id)
+        self.prefetch_tracks(track_ids)
+        self.prefetch_episodes(episode_ids)
+
+    def get_episode(self, episode_id: str) -> dict:
+        return self._get_cached(
+            ("episode", episode_id),
+            self.spotify_api.get_episode,
+            episode_id,
+        )
+
+    def get_show(self, show_id: str) -> dict:
+        return self._get_cached(
+            ("show", show_id),
+            self.spotify_api.get_show,
+            show_id,
+        )
+
+    def get_track_credits(self, track_id: str) -> dict:
+        return self._get_cached(
+            ("track_credits", track_id),
+            self.spotify_api.get_track_credits,
+            track_id,
+        )
+
+    def get_lyrics(self, track_id: str) -> dict | None:
+        return self._get_cached(
+            ("lyrics", track_id),
+            self.spotify_api.get_lyrics,
+            track_id,
+        )
 
     def get_gid_metadata(
         self,
@@ -371,7 +688,19 @@ class Downloader:
         media_type: str,
     ) -> dict:
         gid = self.spotify_api.media_id_to_gid(media_id)
-        return self.spotify_api.get_gid_metadata(gid, media_type)
+        return self._get_cached(
+            ("gid_metadata", gid, media_type),
+            self.spotify_api.get_gid_metadata,
+            gid,
+            media_type,
+        )
+
+    def get_video_manifest(self, gid: str) -> dict:
+        return self._get_cached(
+            ("video_manifest", gid),
+            self.spotify_api.get_video_manifest,
+            gid,
+        )
 
     def get_playplay_decryption_key(self, file_id: str) -> bytes:
         raise NotImplementedError()
@@ -416,13 +745,13 @@ class Downloader:
         release_date: str,
         release_date_precision: str,
     ) -> datetime.datetime:
-        return datetime.datetime.strptime(
+        return _parse_release_date(
             release_date,
             self.RELEASE_DATE_PRECISION_MAPPING[release_date_precision],
         )
 
     def get_release_date_tag(self, datetime_obj: datetime.datetime) -> str:
-        return datetime_obj.strftime(self.date_tag_template)
+        return _format_release_date(datetime_obj, self.date_tag_template)
 
     def get_artist_string(self, artist_list: list[dict]) -> str:
         if len(artist_list) == 1:
@@ -432,13 +761,20 @@ class Downloader:
             + f' & {artist_list[-1]["name"]}'
         )
 
+    @staticmethod
+    def get_role_credits(track_credits: dict) -> dict[str, list[dict]]:
+        return {
+            role.get("roleTitle"): role.get("artists") or []
+            for role in track_credits.get("roleCredits") or ()
+        }
+
     def get_file_temp_path(
         self,
         track_id: str,
         extra_string: str,
         extension: str,
     ) -> Path:
-        return self.temp_path / (track_id + extra_string + extension)
+        return self.temp_path / track_id / (track_id + extra_string + extension)
 
     def apply_tags_ogg(
         self,
@@ -530,43 +866,53 @@ class Downloader:
         playlist_metadata: dict,
         playlist_track: int,
     ):
-        if self.save_cover and cover_path.exists() and not self.overwrite:
-            logger.debug(f'Cover already exists at "{cover_path}", skipping')
-        elif self.save_cover and cover_url is not None:
-            logger.debug(f'Saving cover to "{cover_path}"')
-            self.save_cover_file(cover_path, cover_url)
+        if self.save_cover:
+            with self.get_file_lock(cover_path):
+                if cover_path.exists() and not self.overwrite:
+                    logger.debug('Cover already exists at "%s", skipping', cover_path)
+                elif cover_url is not None:
+                    logger.debug('Saving cover to "%s"', cover_path)
+                    self.save_cover_file(cover_path, cover_url)
         if media_temp_path:
             logger.debug("Applying tags")
             if media_temp_path.suffix in (".mp4", ".m4a"):
                 self.apply_tags_mp4(media_temp_path, tags, cover_url)
             elif media_temp_path.suffix == ".ogg":
                 self.apply_tags_ogg(media_temp_path, tags, cover_url)
-            logger.debug(f'Moving to "{final_path}"')
+            logger.debug('Moving to "%s"', final_path)
             self.move_to_final_path(media_temp_path, final_path)
         if self.save_playlist and playlist_metadata:
             playlist_file_path = self.get_playlist_file_path(tags)
-            logger.debug(f'Updating M3U8 playlist from "{playlist_file_path}"')
+            logger.debug('Updating M3U8 playlist from "%s"', playlist_file_path)
             self.update_playlist_file(
                 playlist_file_path,
                 final_path,
                 playlist_track,
             )
 
-    def cleanup_temp_path(self):
-        if self.temp_path.exists() and not self.skip_cleanup:
-            logger.debug(f'Cleaning up "{self.temp_path}"')
-            shutil.rmtree(self.temp_path)
+    def get_media_lock(self, media_id: str) -> threading.Lock:
+        with self._media_locks_lock:
+            return self._media_locks.setdefault(media_id, threading.Lock())
 
-    @staticmethod
-    @functools.lru_cache()
-    def get_response_bytes(url: str) -> bytes:
-        response = requests.get(url)
-        check_response(response)
-        return response.content
+    def get_file_lock(self, path: Path) -> threading.Lock:
+        with self._file_locks_lock:
+            return self._file_locks.setdefault(path, threading.Lock())
+
+    def cleanup_temp_path(self, media_id: str = None):
+        temp_path = self.temp_path / media_id if media_id else self.temp_path
+        if temp_path.exists() and not self.skip_cleanup:
+            logger.debug('Cleaning up "%s"', temp_path)
+            shutil.rmtree(temp_path)
+
+    def get_response_bytes(self, url: str) -> bytes:
+        return _get_response_bytes(self.spotify_api.cdn_session, url)
 
     def move_to_final_path(self, input_path: Path, final_path: Path):
         final_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(input_path, final_path)
+        try:
+            os.replace(input_path, final_path)
+        except OSError:
+            shutil.move(input_path, final_path)
 
     @functools.lru_cache()
     def save_cover_file(self, cover_path: Path, cover_url: str):
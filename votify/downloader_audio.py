@@ -4,14 +4,13 @@ import subprocess
 from pathlib import Path
 
 from Crypto.Cipher import AES
-from yt_dlp.downloader.http import HttpFD
-from yt_dlp.YoutubeDL import YoutubeDL
 
 from .constants import (
     AAC_AUDIO_QUALITIES,
     AUDIO_QUALITY_X_FORMAT_ID_MAPPING,
     COVER_SIZE_X_KEY_MAPPING_SONG,
     VORBIS_AUDIO_QUALITIES,
+    YTDLP_BUFFER_SIZE,
 )
 from .downloader import Downloader
 from .enums import AudioQuality, DownloadMode, RemuxModeAudio
@@ -22,6 +21,7 @@ class DownloaderAudio:
     DEFAULT_EPISODE_DECRYPTION_KEY = (
         b"\xde\xad\xbe\xef\xde\xad\xbe\xef\xde\xad\xbe\xef\xde\xad\xbe\xef"  # lmao wtf
     )
+    PLAYPLAY_DECRYPT_CHUNK_SIZE = 4 << 20
 
     def __init__(
         self,
@@ -108,12 +108,16 @@ class DownloaderAudio:
             self.download_stream_url_aria2c(input_path, stream_url)
 
     def download_stream_url_ytdlp(self, input_path: Path, stream_url: str) -> None:
+        from yt_dlp.downloader.http import HttpFD
+        from yt_dlp.YoutubeDL import YoutubeDL
+
         input_path.parent.mkdir(parents=True, exist_ok=True)
         with YoutubeDL(
             {
                 "quiet": True,
                 "no_warnings": True,
                 "noprogress": self.downloader.silence,
+                "buffersize": YTDLP_BUFFER_SIZE,
             }
         ) as ydl:
             http_downloader = HttpFD(ydl, ydl.params)
@@ -185,18 +189,25 @@ class DownloaderAudio:
             initial_value=bytes.fromhex("ebe8bc643f630d93"),
         )
 
-        with encrypted_path.open("rb") as encrypted_file:
-            encrypted_data = encrypted_file.read()
-
-        with decrypted_path.open("wb") as decrypted_file:
-            decrypted_data = cipher.decrypt(encrypted_data)
-
-            offset = decrypted_data.find(b"OggS")
-            if offset == -1:
-                msg = "Unable to find ogg header"
-                raise ValueError(msg)
+        with encrypted_path.open("rb") as encrypted_file, decrypted_path.open(
+            "wb"
+        ) as decrypted_file:
+            decrypted_data = b""
+            offset = -1
+            while offset == -1:
+                encrypted_data = encrypted_file.read(self.PLAYPLAY_DECRYPT_CHUNK_SIZE)
+                if not encrypted_data:
+                    msg = "Unable to find ogg header"
+                    raise ValueError(msg)
+                decrypted_data += cipher.decrypt(encrypted_data)
+                offset = decrypted_data.find(b"OggS")
 
-            decrypted_file.write(decrypted_data[offset:])
+            decrypted_file.write(memoryview(decrypted_data)[offset:])
+            while True:
+                encrypted_data = encrypted_file.read(self.PLAYPLAY_DECRYPT_CHUNK_SIZE)
+                if not encrypted_data:
+                    break
+                decrypted_file.write(cipher.decrypt(encrypted_data))
 
     def decrypt_widevine_ffmpeg(
         self,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .constants import AAC_AUDIO_QUALITIES, COVER_SIZE_X_KEY_MAPPING_EPISODE
@@ -15,7 +16,10 @@ class DownloaderEpisode(DownloaderAudio):
         self,
         downloader_audio: DownloaderAudio,
     ):
-        self.__dict__.update(downloader_audio.__dict__)
+        self.downloader = downloader_audio.downloader
+        self.audio_quality = downloader_audio.audio_quality
+        self.download_mode = downloader_audio.download_mode
+        self.remux_mode = downloader_audio.remux_mode
 
     def get_tags(
         self,
@@ -35,16 +39,11 @@ class DownloaderEpisode(DownloaderAudio):
             "release_date": self.downloader.get_release_date_tag(
                 release_date_datetime_obj
             ),
-            "release_year": str(release_date_datetime_obj.year),
+            "release_year": episode_metadata["release_date"][:4],
             "title": episode_metadata["name"],
-            "track": next(
-                index
-                for index in range(1, len(show_metadata["episodes"]["items"]) + 1)
-                if show_metadata["episodes"]["items"][
-                    len(show_metadata["episodes"]["items"]) - index
-                ]["id"]
-                == episode_metadata["id"]
-            ),
+            "track": self.downloader.get_show_episode_numbers(show_metadata)[
+                episode_metadata["id"]
+            ],
             "url": f"https://open.spotify.com/episode/{episode_metadata['id']}",
         }
         return tags
@@ -54,13 +53,15 @@ class DownloaderEpisode(DownloaderAudio):
 
     def download(
         self,
+        episode_id: str,
         *args,
         **kwargs,
     ):
-        try:
-            self._download(*args, **kwargs)
-        finally:
-            self.downloader.cleanup_temp_path()
+        with self.downloader.get_media_lock(episode_id):
+            try:
+                self._download(episode_id, *args, **kwargs)
+            finally:
+                self.downloader.cleanup_temp_path(episode_id)
 
     def _download(
         self,
@@ -75,12 +76,17 @@ class DownloaderEpisode(DownloaderAudio):
     ):
         if not episode_metadata:
             logger.debug("Getting episode metadata")
-            episode_metadata = self.downloader.spotify_api.get_episode(episode_id)
+            episode_metadata = self.downloader.get_episode(episode_id)
         if not show_metadata:
             logger.debug("Getting show metadata")
-            show_metadata = self.downloader.spotify_api.get_show(
-                episode_metadata["show"]["id"]
+            executor = ThreadPoolExecutor(max_workers=1)
+            show_metadata_future = executor.submit(
+                self.downloader.get_show,
+                episode_metadata["show"]["id"],
             )
+            executor.shutdown(wait=False)
+        else:
+            show_metadata_future = None
         if not gid_metadata:
             logger.debug("Getting GID metadata")
             gid_metadata = self.downloader.get_gid_metadata(episode_id, "episode")
@@ -95,6 +101,8 @@ class DownloaderEpisode(DownloaderAudio):
             return
         if stream_info.quality != self.audio_quality:
             logger.warning(f"Quality has been changed to {stream_info.quality.value}")
+        if show_metadata_future is not None:
+            show_metadata = show_metadata_future.result()
         tags = self.get_tags(
             episode_metadata,
             show_metadata,
@@ -143,10 +151,10 @@ class DownloaderEpisode(DownloaderAudio):
                 "_remuxed",
                 file_extension,
             )
-            logger.debug(f'Downloading to "{encrypted_path}"')
+            logger.debug('Downloading to "%s"', encrypted_path)
             self.download_stream_url(encrypted_path, stream_info.stream_url)
             logger.debug(
-                f'Decrypting to "{decrypted_path}" and remuxing to "{remuxed_path}"'
+                'Decrypting to "%s" and remuxing to "%s"', decrypted_path, remuxed_path
             )
             self.decrypt(
                 decryption_key,
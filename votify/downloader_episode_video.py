@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from .downloader_episode import DownloaderEpisode
 from .downloader_video import DownloaderVideo
@@ -15,7 +16,10 @@ class DownloaderEpisodeVideo(DownloaderVideo):
         downloader_video: DownloaderVideo,
         downloader_episode: DownloaderEpisode,
     ):
-        self.__dict__.update(downloader_video.__dict__)
+        self.downloader = downloader_video.downloader
+        self.video_format = downloader_video.video_format
+        self.remux_mode = downloader_video.remux_mode
+        self.download_mode = downloader_video.download_mode
         self.downloader_episode = downloader_episode
 
     def get_video_gid(self, gid_metadata: dict) -> str | None:
@@ -25,13 +29,15 @@ class DownloaderEpisodeVideo(DownloaderVideo):
 
     def download(
         self,
+        episode_id: str,
         *args,
         **kwargs,
     ):
-        try:
-            self._download(*args, **kwargs)
-        finally:
-            self.downloader.cleanup_temp_path()
+        with self.downloader.get_media_lock(episode_id):
+            try:
+                self._download(episode_id, *args, **kwargs)
+            finally:
+                self.downloader.cleanup_temp_path(episode_id)
 
     def _download(
         self,
@@ -44,12 +50,17 @@ class DownloaderEpisodeVideo(DownloaderVideo):
     ):
         if not episode_metadata:
             logger.debug("Getting episode metadata")
-            episode_metadata = self.downloader.spotify_api.get_episode(episode_id)
+            episode_metadata = self.downloader.get_episode(episode_id)
         if not show_metadata:
             logger.debug("Getting show metadata")
-            show_metadata = self.downloader.spotify_api.get_show(
-                episode_metadata["show"]["id"]
+            executor = ThreadPoolExecutor(max_workers=1)
+            show_metadata_future = executor.submit(
+                self.downloader.get_show,
+                episode_metadata["show"]["id"],
             )
+            executor.shutdown(wait=False)
+        else:
+            show_metadata_future = None
         if not gid_metadata:
             logger.debug("Getting GID metadata")
             gid_metadata = self.downloader.get_gid_metadata(episode_id, "episode")
@@ -67,6 +78,8 @@ class DownloaderEpisodeVideo(DownloaderVideo):
                 f'"{self.downloader.wvd_path}", skipping'
             )
             return
+        if show_metadata_future is not None:
+            show_metadata = show_metadata_future.result()
         tags = self.downloader_episode.get_tags(
             episode_metadata,
             show_metadata,
@@ -98,16 +111,6 @@ class DownloaderEpisodeVideo(DownloaderVideo):
                 if stream_info.encryption_data_widevine
                 else (None, None)
             )
-            encrypted_path_video = self.downloader.get_file_temp_path(
-                episode_id,
-                "_video_encrypted",
-                file_extension,
-            )
-            encrypted_path_audio = self.downloader.get_file_temp_path(
-                episode_id,
-                "_audio_encrypted",
-                file_extension,
-            )
             decrypted_path_video = self.downloader.get_file_temp_path(
                 episode_id,
                 "_video_decrypted",
@@ -123,22 +126,40 @@ class DownloaderEpisodeVideo(DownloaderVideo):
                 "_remuxed",
                 file_extension,
             )
-            temp_path_video = encrypted_path_video if key_id else decrypted_path_video
-            temp_path_audio = encrypted_path_audio if key_id else decrypted_path_audio
-            logger.debug(f'Downloading video to "{temp_path_video}"')
-            self.download_segments(stream_info.segment_urls_video, temp_path_video)
-            logger.debug(f'Downloading audio to "{temp_path_audio}"')
-            self.download_segments(stream_info.segment_urls_audio, temp_path_audio)
-            logger.debug(f'Remuxing to "{remuxed_path}"')
-            self.remux(
+            if key_id:
+                encrypted_path_video = self.downloader.get_file_temp_path(
+                    episode_id,
+                    "_video_encrypted",
+                    file_extension,
+                )
+                encrypted_path_audio = self.downloader.get_file_temp_path(
+                    episode_id,
+                    "_audio_encrypted",
+                    file_extension,
+                )
+            else:
+                encrypted_path_video = None
+                encrypted_path_audio = None
+            logger.debug(
+                'Downloading and decrypting video/audio to "%s/%s"',
+                decrypted_path_video,
+                decrypted_path_audio,
+            )
+            self.download_streams(
+                stream_info,
                 decrypted_path_video,
                 decrypted_path_audio,
-                remuxed_path,
                 key_id,
                 decryption_key,
                 encrypted_path_video,
                 encrypted_path_audio,
             )
+            logger.debug('Remuxing to "%s"', remuxed_path)
+            self.remux(
+                decrypted_path_video,
+                decrypted_path_audio,
+                remuxed_path,
+            )
         self.downloader._final_processing(
             cover_path,
             cover_url,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
@@ -16,7 +17,10 @@ class DownloaderMusicVideo(DownloaderVideo):
         self,
         downloader_video: DownloaderVideo,
     ):
-        self.__dict__.update(downloader_video.__dict__)
+        self.downloader = downloader_video.downloader
+        self.video_format = downloader_video.video_format
+        self.remux_mode = downloader_video.remux_mode
+        self.download_mode = downloader_video.download_mode
 
     def get_video_gid(self, gid_metadata: dict) -> str | None:
         if not gid_metadata.get("original_video"):
@@ -29,48 +33,32 @@ class DownloaderMusicVideo(DownloaderVideo):
         album_metadata: dict,
         track_credits: dict,
     ) -> dict:
+        downloader = self.downloader
         external_ids = track_metadata.get("external_ids")
         external_urls = (track_metadata.get("linked_from") or track_metadata)[
             "external_urls"
         ]
-        release_date_datetime_obj = self.downloader.get_release_date_datetime_obj(
+        role_credits = downloader.get_role_credits(track_credits)
+        release_date_datetime_obj = downloader.get_release_date_datetime_obj(
             album_metadata["release_date"],
             album_metadata["release_date_precision"],
         )
-        producers = next(
-            role
-            for role in track_credits["roleCredits"]
-            if role["roleTitle"] == "Producers"
-        )["artists"]
-        composers = next(
-            role
-            for role in track_credits["roleCredits"]
-            if role["roleTitle"] == "Writers"
-        )["artists"]
+        producers = role_credits.get("Producers")
+        composers = role_credits.get("Writers")
         tags = {
-            "artist": self.downloader.get_artist_string(track_metadata["artists"]),
-            "composer": (
-                self.downloader.get_artist_string(composers) if composers else None
-            ),
-            "copyright": next(
-                (i["text"] for i in album_metadata["copyrights"] if i["type"] == "P"),
-                None,
-            ),
+            "artist": downloader.get_artist_string(track_metadata["artists"]),
+            "composer": downloader.get_artist_string(composers) if composers else None,
+            "copyright": downloader.get_album_copyrights(album_metadata).get("P"),
             "isrc": external_ids.get("isrc") if external_ids is not None else None,
             "label": album_metadata.get("label"),
             "media_type": "Music video",
-            "producer": (
-                self.downloader.get_artist_string(producers) if producers else None
-            ),
+            "producer": downloader.get_artist_string(producers) if producers else None,
             "rating": "Explicit" if track_metadata.get("explicit") else "Unknown",
             "title": track_metadata["name"],
-            "release_date": self.downloader.get_release_date_tag(
-                release_date_datetime_obj
-            ),
-            "release_year": str(release_date_datetime_obj.year),
+            "release_date": downloader.get_release_date_tag(release_date_datetime_obj),
+            "release_year": album_metadata["release_date"][:4],
             "url": external_urls["spotify"],
         }
-        tags["release_year"] = str(release_date_datetime_obj.year)
         return tags
 
     def get_music_video_id_from_song_id(
@@ -115,23 +103,14 @@ class DownloaderMusicVideo(DownloaderVideo):
                 for related_music_video in related_music_videos
             ]
         )
-        selected_music_video_id = inquirer.select(
-            message="Select which music video to download: (Artist | Title)",
-            choices=choices,
-        ).execute()
+        with self.downloader.prompt_lock:
+            selected_music_video_id = inquirer.select(
+                message="Select which music video to download: (Artist | Title)",
+                choices=choices,
+            ).execute()
         return selected_music_video_id
 
     def download(
-        self,
-        *args,
-        **kwargs,
-    ):
-        try:
-            self._download(*args, **kwargs)
-        finally:
-            self.downloader.cleanup_temp_path()
-
-    def _download(
         self,
         music_video_id: str,
         music_video_metadata: dict = None,
@@ -142,10 +121,10 @@ class DownloaderMusicVideo(DownloaderVideo):
     ):
         if not music_video_metadata:
             logger.debug("Getting music video metadata")
-            music_video_metadata = self.downloader.spotify_api.get_track(music_video_id)
+            music_video_metadata = self.downloader.get_track(music_video_id)
         if not album_metadata:
             logger.debug("Getting album metadata")
-            album_metadata = self.downloader.spotify_api.get_album(
+            album_metadata = self.downloader.get_album(
                 music_video_metadata["album"]["id"]
             )
         if not gid_metadata:
@@ -163,18 +142,45 @@ class DownloaderMusicVideo(DownloaderVideo):
                     "No related music videos found or no music video selected, skipping"
                 )
                 return
-            music_video_metadata = self.downloader.spotify_api.get_track(music_video_id)
+            music_video_metadata = self.downloader.get_track(music_video_id)
             logger.warning(
                 f'Switching to downloading music video "{music_video_metadata["name"]}"'
             )
-            album_metadata = self.downloader.spotify_api.get_album(
+            album_metadata = self.downloader.get_album(
                 music_video_metadata["album"]["id"]
             )
             gid_metadata = self.downloader.get_gid_metadata(music_video_id, "track")
             video_gid = self.get_video_gid(gid_metadata)
-        stream_info = self.get_stream_info(video_gid)
-        logger.debug("Getting credits")
-        track_credits = self.downloader.spotify_api.get_track_credits(music_video_id)
+        with self.downloader.get_media_lock(music_video_id):
+            try:
+                self._download(
+                    music_video_id,
+                    music_video_metadata,
+                    album_metadata,
+                    video_gid,
+                    playlist_metadata,
+                    playlist_track,
+                )
+            finally:
+                self.downloader.cleanup_temp_path(music_video_id)
+
+    def _download(
+        self,
+        music_video_id: str,
+        music_video_metadata: dict,
+        album_metadata: dict,
+        video_gid: str,
+        playlist_metadata: dict = None,
+        playlist_track: int = None,
+    ):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            logger.debug("Getting credits")
+            track_credits_future = executor.submit(
+                self.downloader.get_track_credits,
+                music_video_id,
+            )
+            stream_info = self.get_stream_info(video_gid)
+            track_credits = track_credits_future.result()
         tags = self.get_tags(
             music_video_metadata,
             album_metadata,
@@ -228,22 +234,26 @@ class DownloaderMusicVideo(DownloaderVideo):
                 "_remuxed",
                 file_extension,
             )
-            logger.debug(f'Downloading video to "{encrypted_path_video}"')
-            self.download_segments(stream_info.segment_urls_video, encrypted_path_video)
-            logger.debug(f'Downloading audio to "{encrypted_path_audio}"')
-            self.download_segments(stream_info.segment_urls_audio, encrypted_path_audio)
             logger.debug(
-                f'Decryping video/audio to "{decrypted_path_video}/{decrypted_path_audio}" and remuxing to "{remuxed_path}"'
+                'Downloading and decrypting video/audio to "%s/%s"',
+                decrypted_path_video,
+                decrypted_path_audio,
             )
-            self.remux(
+            self.download_streams(
+                stream_info,
                 decrypted_path_video,
                 decrypted_path_audio,
-                remuxed_path,
                 key_id,
                 decryption_key,
                 encrypted_path_video,
                 encrypted_path_audio,
             )
+            logger.debug('Remuxing to "%s"', remuxed_path)
+            self.remux(
+                decrypted_path_video,
+                decrypted_path_audio,
+                remuxed_path,
+            )
         self.downloader._final_processing(
             cover_path,
             cover_url,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .constants import COVER_SIZE_X_KEY_MAPPING_SONG
@@ -18,7 +18,10 @@ class DownloaderSong(DownloaderAudio):
         lrc_only: bool = False,
         no_lrc: bool = False,
     ):
-        self.__dict__.update(downloader_audio.__dict__)
+        self.downloader = downloader_audio.downloader
+        self.audio_quality = downloader_audio.audio_quality
+        self.download_mode = downloader_audio.download_mode
+        self.remux_mode = downloader_audio.remux_mode
         self.lrc_only = lrc_only
         self.no_lrc = no_lrc
 
@@ -26,104 +29,93 @@ class DownloaderSong(DownloaderAudio):
         self,
         track_metadata: dict,
         album_metadata: dict,
-        track_credits: dict,
-        lyrics_unsynced: str,
+        track_credits: dict = None,
+        lyrics_unsynced: str = None,
     ) -> dict:
+        downloader = self.downloader
         external_ids = track_metadata.get("external_ids")
         external_urls = (track_metadata.get("linked_from") or track_metadata)[
             "external_urls"
         ]
-        track_id = self.downloader.get_media_id(track_metadata)
-        release_date_datetime_obj = self.downloader.get_release_date_datetime_obj(
+        release_date_datetime_obj = downloader.get_release_date_datetime_obj(
             album_metadata["release_date"],
             album_metadata["release_date_precision"],
         )
-        producers = next(
-            role
-            for role in track_credits["roleCredits"]
-            if role["roleTitle"] == "Producers"
-        )["artists"]
-        composers = next(
-            role
-            for role in track_credits["roleCredits"]
-            if role["roleTitle"] == "Writers"
-        )["artists"]
-        disc = next(
-            (
-                track["disc_number"]
-                for track in album_metadata["tracks"]["items"]
-                if self.downloader.get_media_id(track) == track_id
-            ),
-        )
+        album_index = downloader.get_album_index(album_metadata)
+        album_track = album_index.tracks[downloader.get_media_id(track_metadata)]
+        disc = album_track["disc_number"]
         tags = {
             "album": album_metadata["name"],
-            "album_artist": self.downloader.get_artist_string(
-                album_metadata["artists"]
-            ),
-            "artist": self.downloader.get_artist_string(track_metadata["artists"]),
-            "compilation": (
-                True if album_metadata["album_type"] == "compilation" else False
-            ),
-            "composer": (
-                self.downloader.get_artist_string(composers) if composers else None
-            ),
-            "copyright": next(
-                (i["text"] for i in album_metadata["copyrights"] if i["type"] == "P"),
-                None,
-            ),
-            "disc": int(disc),
-            "disc_total": int(album_metadata["tracks"]["items"][-1]["disc_number"]),
+            "album_artist": album_index.album_artist,
+            "artist": downloader.get_artist_string(track_metadata["artists"]),
+            "compilation": album_metadata["album_type"] == "compilation",
+            "copyright": downloader.get_album_copyrights(album_metadata).get("P"),
+            "disc": disc,
+            "disc_total": album_index.disc_total,
             "isrc": external_ids.get("isrc") if external_ids is not None else None,
             "label": album_metadata.get("label"),
             "lyrics": lyrics_unsynced,
             "media_type": "Song",
-            "producer": (
-                self.downloader.get_artist_string(producers) if producers else None
-            ),
             "rating": "Explicit" if track_metadata.get("explicit") else "Unknown",
-            "release_date": self.downloader.get_release_date_tag(
-                release_date_datetime_obj
-            ),
-            "release_year": str(release_date_datetime_obj.year),
+            "release_date": downloader.get_release_date_tag(release_date_datetime_obj),
+            "release_year": album_metadata["release_date"][:4],
             "title": track_metadata["name"],
-            "track": int(
-                next(
-                    (
-                        track["track_number"]
-                        for track in album_metadata["tracks"]["items"]
-                        if self.downloader.get_media_id(track) == track_id
-                    ),
-                )
-            ),
-            "track_total": int(
-                max(
-                    track["track_number"]
-                    for track in album_metadata["tracks"]["items"]
-                    if track["disc_number"] == disc
-                )
-            ),
+            "track": album_track["track_number"],
+            "track_total": album_index.track_totals[disc],
             "url": external_urls["spotify"],
         }
+        if track_credits is not None:
+            role_credits = downloader.get_role_credits(track_credits)
+            producers = role_credits.get("Producers")
+            composers = role_credits.get("Writers")
+            tags["composer"] = (
+                downloader.get_artist_string(composers) if composers else None
+            )
+            tags["producer"] = (
+                downloader.get_artist_string(producers) if producers else None
+            )
         return tags
 
-    def get_lyrics_synced_timestamp_lrc(self, time: int) -> str:
-        lrc_timestamp = datetime.datetime.fromtimestamp(
-            time / 1000.0, tz=datetime.timezone.utc
-        )
-        return lrc_timestamp.strftime("%M:%S.%f")[:-4]
+    def get_final_path_preview(
+        self,
+        track_metadata: dict,
+        album_metadata: dict,
+        playlist_metadata: dict,
+        playlist_track: int,
+        file_extension: str,
+    ) -> Path | None:
+        tags = self.get_tags(track_metadata, album_metadata)
+        if playlist_metadata:
+            tags = {
+                **tags,
+                **self.downloader.get_playlist_tags(
+                    playlist_metadata,
+                    playlist_track,
+                ),
+            }
+        try:
+            return self.downloader.get_final_path("track", tags, file_extension)
+        except KeyError:
+            return None
+
+    @staticmethod
+    def get_lyrics_synced_timestamp_lrc(time: int) -> str:
+        minutes, milliseconds = divmod(time, 60000)
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        return f"{minutes:02d}:{seconds:02d}.{milliseconds // 10:02d}"
 
     def get_lyrics(self, track_id: str) -> Lyrics:
         lyrics = Lyrics()
-        raw_lyrics = self.downloader.spotify_api.get_lyrics(track_id)
+        raw_lyrics = self.downloader.get_lyrics(track_id)
         if raw_lyrics is None:
             return lyrics
-        lyrics.synced = ""
-        lyrics.unsynced = ""
-        for line in raw_lyrics["lyrics"]["lines"]:
-            if raw_lyrics["lyrics"]["syncType"] == "LINE_SYNCED":
-                lyrics.synced += f'[{self.get_lyrics_synced_timestamp_lrc(int(line["startTimeMs"]))}]{line["words"]}\n'
-            lyrics.unsynced += f'{line["words"]}\n'
-        lyrics.unsynced = lyrics.unsynced[:-1]
+        lines = raw_lyrics["lyrics"]["lines"]
+        if raw_lyrics["lyrics"]["syncType"] == "LINE_SYNCED":
+            lyrics.synced = "".join(
+                f'[{self.get_lyrics_synced_timestamp_lrc(int(line["startTimeMs"]))}]{line["words"]}\n'
+                for line in lines
+            )
+        lyrics.unsynced = "\n".join(line["words"] for line in lines)
         return lyrics
 
     def get_cover_path(self, final_path: Path) -> Path:
@@ -131,13 +123,15 @@ class DownloaderSong(DownloaderAudio):
 
     def download(
         self,
+        track_id: str,
         *args,
         **kwargs,
     ):
-        try:
-            self._download(*args, **kwargs)
-        finally:
-            self.downloader.cleanup_temp_path()
+        with self.downloader.get_media_lock(track_id):
+            try:
+                self._download(track_id, *args, **kwargs)
+            finally:
+                self.downloader.cleanup_temp_path(track_id)
 
     def _download(
         self,
@@ -152,53 +146,110 @@ class DownloaderSong(DownloaderAudio):
     ):
         if not track_metadata:
             logger.debug("Getting track metadata")
-            track_metadata = self.downloader.spotify_api.get_track(track_id)
+            track_metadata = self.downloader.get_track(track_id)
         if not album_metadata:
             logger.debug("Getting album metadata")
-            album_metadata = self.downloader.spotify_api.get_album(
-                track_metadata["album"]["id"]
-            )
+            album_metadata = self.downloader.get_album(track_metadata["album"]["id"])
+        file_extension = self.get_file_extension()
+        final_path = self.get_final_path_preview(
+            track_metadata,
+            album_metadata,
+            playlist_metadata,
+            playlist_track,
+            file_extension,
+        )
+        media_exists = (
+            not self.lrc_only
+            and not self.downloader.overwrite
+            and final_path is not None
+            and final_path.exists()
+        )
+        lrc_needed = not self.no_lrc and not (
+            final_path is not None
+            and not self.downloader.overwrite
+            and self.downloader.get_lrc_path(final_path).exists()
+        )
+        lyrics_tag_needed = (
+            not media_exists
+            and not self.lrc_only
+            and "lyrics" not in self.downloader.exclude_tags_list
+        )
         if not gid_metadata:
             logger.debug("Getting GID metadata")
             gid_metadata = self.downloader.get_gid_metadata(track_id, "track")
-        if not stream_info:
-            logger.debug("Getting stream info")
-            stream_info = self.get_stream_info(gid_metadata, "track")
-        if not stream_info.file_id:
-            logger.warning(
-                "Track is not available on Spotify's "
-                "servers and no alternative found, skipping"
+        lyrics_needed = gid_metadata.get("has_lyrics") and (
+            lrc_needed or lyrics_tag_needed
+        )
+        if self.lrc_only and not lyrics_needed:
+            logger.debug("No synced lyrics to save, skipping")
+            return
+        if (
+            media_exists
+            and not lyrics_needed
+            and not (
+                self.downloader.save_cover
+                and not self.get_cover_path(final_path).exists()
             )
+            and not (self.downloader.save_playlist and playlist_metadata)
+        ):
+            logger.warning(f'Track already exists at "{final_path}", skipping')
             return
-        if stream_info.quality != self.audio_quality:
-            logger.warning(f"Quality has been changed to {stream_info.quality.value}")
-        if gid_metadata.get("has_lyrics"):
-            logger.debug("Getting lyrics")
-            lyrics = self.get_lyrics(track_id)
-        else:
-            lyrics = Lyrics()
-        logger.debug("Getting track credits")
-        track_credits = self.downloader.spotify_api.get_track_credits(track_id)
-        tags = self.get_tags(
-            track_metadata,
-            album_metadata,
-            track_credits,
-            lyrics.unsynced,
-        )
-        if playlist_metadata:
-            tags = {
-                **tags,
-                **self.downloader.get_playlist_tags(
-                    playlist_metadata,
-                    playlist_track,
-                ),
-            }
-        file_extension = self.get_file_extension()
-        final_path = self.downloader.get_final_path(
-            "track",
-            tags,
-            file_extension,
-        )
+        skip_media = self.lrc_only or media_exists
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if skip_media and final_path is not None:
+                track_credits_future = None
+            else:
+                logger.debug("Getting track credits")
+                track_credits_future = executor.submit(
+                    self.downloader.get_track_credits,
+                    track_id,
+                )
+            if lyrics_needed:
+                logger.debug("Getting lyrics")
+                lyrics_future = executor.submit(self.get_lyrics, track_id)
+            else:
+                lyrics_future = None
+            if not skip_media:
+                if not stream_info:
+                    logger.debug("Getting stream info")
+                    stream_info = self.get_stream_info(gid_metadata, "track")
+                if not stream_info.file_id:
+                    logger.warning(
+                        "Track is not available on Spotify's "
+                        "servers and no alternative found, skipping"
+                    )
+                    return
+                if stream_info.quality != self.audio_quality:
+                    logger.warning(
+                        f"Quality has been changed to {stream_info.quality.value}"
+                    )
+            lyrics = lyrics_future.result() if lyrics_future is not None else Lyrics()
+            track_credits = (
+                track_credits_future.result()
+                if track_credits_future is not None
+                else None
+            )
+        if not self.lrc_only or final_path is None:
+            tags = self.get_tags(
+                track_metadata,
+                album_metadata,
+                track_credits,
+                lyrics.unsynced,
+            )
+            if playlist_metadata:
+                tags = {
+                    **tags,
+                    **self.downloader.get_playlist_tags(
+                        playlist_metadata,
+                        playlist_track,
+                    ),
+                }
+        if final_path is None:
+            final_path = self.downloader.get_final_path(
+                "track",
+                tags,
+                file_extension,
+            )
         lrc_path = self.downloader.get_lrc_path(final_path)
         cover_path = self.get_cover_path(final_path)
         cover_url = self.downloader.get_cover_url(
@@ -212,42 +263,52 @@ class DownloaderSong(DownloaderAudio):
         elif final_path.exists() and not self.downloader.overwrite:
             logger.warning(f'Track already exists at "{final_path}", skipping')
         else:
-            if not decryption_key:
-                logger.debug("Getting decryption key")
-                decryption_key = self.get_decryption_key(stream_info)
-            encrypted_path = self.downloader.get_file_temp_path(
-                track_id,
-                "_encrypted",
-                file_extension,
-            )
-            decrypted_path = self.downloader.get_file_temp_path(
-                track_id,
-                "_decrypted",
-                file_extension,
-            )
-            remuxed_path = self.downloader.get_file_temp_path(
-                track_id,
-                "_remuxed",
-                file_extension,
-            )
-            logger.debug(f'Downloading to "{encrypted_path}"')
-            self.download_stream_url(encrypted_path, stream_info.stream_url)
-            logger.debug(
-                f'Decrypting to "{decrypted_path}" and remuxing to "{remuxed_path}"'
-            )
-            self.decrypt(
-                decryption_key,
-                encrypted_path,
-                decrypted_path,
-                remuxed_path,
-            )
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                if cover_url is not None and (
+                    "cover" not in self.downloader.exclude_tags_list
+                    or self.downloader.save_cover
+                ):
+                    executor.submit(self.downloader.get_response_bytes, cover_url)
+                if not decryption_key:
+                    logger.debug("Getting decryption key")
+                    decryption_key = self.get_decryption_key(stream_info)
+                encrypted_path = self.downloader.get_file_temp_path(
+                    track_id,
+                    "_encrypted",
+                    file_extension,
+                )
+                decrypted_path = self.downloader.get_file_temp_path(
+                    track_id,
+                    "_decrypted",
+                    file_extension,
+                )
+                remuxed_path = self.downloader.get_file_temp_path(
+                    track_id,
+                    "_remuxed",
+                    file_extension,
+                )
+                logger.debug('Downloading to "%s"', encrypted_path)
+                self.download_stream_url(encrypted_path, stream_info.stream_url)
+                logger.debug(
+                    'Decrypting to "%s" and remuxing to "%s"',
+                    decrypted_path,
+                    remuxed_path,
+                )
+                self.decrypt(
+                    decryption_key,
+                    encrypted_path,
+                    decrypted_path,
+                    remuxed_path,
+                )
         if self.no_lrc or not lyrics.synced:
             pass
         elif lrc_path.exists() and not self.downloader.overwrite:
-            logger.debug(f'Synced lyrics already exists at "{lrc_path}", skipping')
+            logger.debug('Synced lyrics already exists at "%s", skipping', lrc_path)
         else:
-            logger.debug(f'Saving synced lyrics to "{lrc_path}"')
+            logger.debug('Saving synced lyrics to "%s"', lrc_path)
             self.downloader.save_lrc(lrc_path, lyrics.synced)
+        if self.lrc_only:
+            return
         media_temp_path = (
             remuxed_path
             if remuxed_path is not None and remuxed_path.exists()
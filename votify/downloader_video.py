@@ -1,29 +1,36 @@
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
-from yt_dlp.downloader.fragment import FragmentFD
-from yt_dlp.YoutubeDL import YoutubeDL
 
-from .constants import COVER_SIZE_X_KEY_MAPPING_VIDEO
+from .constants import COVER_SIZE_X_KEY_MAPPING_VIDEO, YTDLP_BUFFER_SIZE
 from .downloader import Downloader
-from .enums import RemuxModeAudio, RemuxModeVideo, VideoFormat
+from .enums import DownloadMode, RemuxModeVideo, VideoFormat
 from .models import StreamInfoVideo
 
 
 class DownloaderVideo:
+    CONCURRENT_FRAGMENT_DOWNLOADS = 8
+
     def __init__(
         self,
         downloader: Downloader,
         video_format: VideoFormat = VideoFormat.MP4,
         remux_mode: RemuxModeVideo = RemuxModeVideo.FFMPEG,
+        download_mode: DownloadMode = DownloadMode.YTDLP,
     ):
         self.downloader = downloader
         self.video_format = video_format
         self.remux_mode = remux_mode
+        self.download_mode = download_mode
         self._adjust_remux_mode()
 
     def _adjust_remux_mode(self):
@@ -57,46 +64,45 @@ class DownloaderVideo:
         gid: str,
     ) -> StreamInfoVideo:
         stream_info = StreamInfoVideo()
-        manifest = self.downloader.spotify_api.get_video_manifest(gid)
+        manifest = self.downloader.get_video_manifest(gid)
         base_url = manifest["base_urls"][0]
         initialization_template = manifest["initialization_template"]
         segment_template = manifest["segment_template"]
         end_time_millis = manifest["end_time_millis"]
-        segment_length = manifest["contents"][0]["segment_length"]
+        content = manifest["contents"][0]
+        segment_length = content["segment_length"]
         encryption_index = None
-        if manifest["contents"][0].get("encryption_infos"):
+        if content.get("encryption_infos"):
             encryption_index, encryption_info = self.get_encryption_info(
-                manifest["contents"][0]["encryption_infos"],
+                content["encryption_infos"],
                 "widevine",
             )
             stream_info.encryption_data_widevine = encryption_info["encryption_data"]
-        video_profiles = list(
-            filter(
-                lambda x: x["mime_type"].startswith("video")
-                and encryption_index
-                in (x.get("encryption_indices", [encryption_index])),
-                manifest["contents"][0]["profiles"],
-            )
-        )
-        audio_profiles = list(
-            filter(
-                lambda x: x["mime_type"].startswith("audio")
-                and encryption_index
-                in (x.get("encryption_indices", [encryption_index])),
-                manifest["contents"][0]["profiles"],
-            )
-        )
+        video_profiles = []
+        audio_profiles = []
+        encryption_indices_default = (encryption_index,)
+        for profile in content["profiles"]:
+            if encryption_index not in profile.get(
+                "encryption_indices",
+                encryption_indices_default,
+            ):
+                continue
+            if profile["mime_type"].startswith("video"):
+                video_profiles.append(profile)
+            elif profile["mime_type"].startswith("audio"):
+                audio_profiles.append(profile)
         if not video_profiles or not audio_profiles:
             return stream_info
         if self.video_format == VideoFormat.ASK:
-            profile_video, profile_audio = (
-                self.get_video_profile_from_user(
-                    video_profiles,
-                ),
-                self.get_audio_profile_from_user(
-                    audio_profiles,
-                ),
-            )
+            with self.downloader.prompt_lock:
+                profile_video, profile_audio = (
+                    self.get_video_profile_from_user(
+                        video_profiles,
+                    ),
+                    self.get_audio_profile_from_user(
+                        audio_profiles,
+                    ),
+                )
         else:
             profile_video, profile_audio = (
                 self.get_best_profile_by_bitrate(
@@ -139,14 +145,11 @@ class DownloaderVideo:
         profiles: list[dict],
         mime_type: str,
     ) -> str:
-        profiles_filtered = list(
-            filter(
-                lambda x: x["mime_type"] == mime_type,
-                profiles,
-            )
-        )
         bitrate_key = f"{mime_type.split('/')[0]}_bitrate"
-        best_profile = max(profiles_filtered, key=lambda x: x[bitrate_key])
+        best_profile = max(
+            (profile for profile in profiles if profile["mime_type"] == mime_type),
+            key=itemgetter(bitrate_key),
+        )
         return best_profile
 
     def get_video_profile_from_user(
@@ -207,16 +210,17 @@ class DownloaderVideo:
         initialization_template_formatted = initialization_template.replace(
             "{{profile_id}}", str(profile_id)
         ).replace("{{file_type}}", file_type)
-        segment_urls = []
-        first_segment = base_url + initialization_template_formatted
-        segment_urls.append(first_segment)
-        for i in range(0, int(end_time_millis / 1000) + 5, segment_length):
-            segment_template_url_formatted = (
-                segment_template.replace("{{profile_id}}", str(profile_id))
-                .replace("{{segment_timestamp}}", str(i))
-                .replace("{{file_type}}", file_type)
+        segment_url_parts = (
+            base_url
+            + segment_template.replace("{{profile_id}}", str(profile_id)).replace(
+                "{{file_type}}", file_type
             )
-            segment_urls.append(base_url + segment_template_url_formatted)
+        ).split("{{segment_timestamp}}")
+        segment_urls = [base_url + initialization_template_formatted]
+        segment_urls += [
+            str(i).join(segment_url_parts)
+            for i in range(0, end_time_millis // 1000 + 5, segment_length)
+        ]
         return segment_urls
 
     def download_segments(
@@ -224,6 +228,19 @@ class DownloaderVideo:
         segment_urls: list[str],
         input_path: Path,
     ):
+        if self.download_mode == DownloadMode.YTDLP:
+            self.download_segments_ytdlp(segment_urls, input_path)
+        elif self.download_mode == DownloadMode.ARIA2C:
+            self.download_segments_aria2c(segment_urls, input_path)
+
+    def download_segments_ytdlp(
+        self,
+        segment_urls: list[str],
+        input_path: Path,
+    ):
+        from yt_dlp.downloader.fragment import FragmentFD
+        from yt_dlp.YoutubeDL import YoutubeDL
+
         input_path.parent.mkdir(parents=True, exist_ok=True)
         segments_dict = [
             {"url": url, "frag_index": idx + 1} for idx, url in enumerate(segment_urls)
@@ -238,6 +255,8 @@ class DownloaderVideo:
                 "quiet": True,
                 "no_warnings": True,
                 "noprogress": self.downloader.silence,
+                "concurrent_fragment_downloads": self.CONCURRENT_FRAGMENT_DOWNLOADS,
+                "buffersize": YTDLP_BUFFER_SIZE,
             },
         ) as ydl:
             try:
@@ -254,42 +273,151 @@ class DownloaderVideo:
             finally:
                 fragment_downloader._finish_multiline_status()
 
-    def remux(
+    def download_segments_aria2c(
         self,
+        segment_urls: list[str],
+        input_path: Path,
+    ):
+        segments_path = input_path.with_name(input_path.stem + "_segments")
+        segments_path.mkdir(parents=True, exist_ok=True)
+        segment_names = [f"seg_{index:06d}" for index in range(len(segment_urls))]
+        segments_list_path = segments_path / "segments.txt"
+        segments_list_path.write_text(
+            "".join(
+                f"{url}\n  out={name}\n"
+                for url, name in zip(segment_urls, segment_names)
+            ),
+            encoding="utf8",
+        )
+        subprocess.run(
+            [
+                self.downloader.aria2c_path_full,
+                "--no-conf",
+                "--download-result=hide",
+                "--console-log-level=error",
+                "--summary-interval=0",
+                "--file-allocation=none",
+                "--auto-file-renaming=false",
+                "--allow-overwrite=true",
+                "--max-concurrent-downloads",
+                str(self.CONCURRENT_FRAGMENT_DOWNLOADS),
+                "--input-file",
+                segments_list_path,
+                "--dir",
+                segments_path,
+            ],
+            check=True,
+            **self.downloader.subprocess_additional_args,
+        )
+        print("\r", end="")
+        with input_path.open("wb") as input_file:
+            for index, segment_name in enumerate(segment_names):
+                segment_path = segments_path / segment_name
+                if not segment_path.exists():
+                    raise RuntimeError(f"Failed to download segment {index}")
+                self.append_file(input_file, segment_path)
+                segment_path.unlink()
+
+    @staticmethod
+    def append_file(output_file: typing.BinaryIO, input_path: Path):
+        with input_path.open("rb") as input_file:
+            offset = 0
+            size = os.fstat(input_file.fileno()).st_size
+            output_file.flush()
+            try:
+                while offset < size:
+                    sent = os.sendfile(
+                        output_file.fileno(),
+                        input_file.fileno(),
+                        offset,
+                        size - offset,
+                    )
+                    if not sent:
+                        break
+                    offset += sent
+            except (AttributeError, OSError):
+                input_file.seek(offset)
+                shutil.copyfileobj(input_file, output_file, YTDLP_BUFFER_SIZE)
+
+    def download_stream(
+        self,
+        segment_urls: list[str],
+        decrypted_path: Path,
+        key_id: str | None = None,
+        decryption_key: str | None = None,
+        encrypted_path: Path | None = None,
+    ):
+        if not decryption_key:
+            self.download_segments(segment_urls, decrypted_path)
+            return
+        self.download_segments(segment_urls, encrypted_path)
+        self.decrypt(
+            key_id,
+            decryption_key,
+            encrypted_path,
+            decrypted_path,
+        )
+
+    def download_streams(
+        self,
+        stream_info: StreamInfoVideo,
         decrypted_path_video: Path,
         decrypted_path_audio: Path,
-        remuxed_path: Path,
         key_id: str | None = None,
         decryption_key: str | None = None,
         encrypted_path_video: Path | None = None,
         encrypted_path_audio: Path | None = None,
     ):
-        if decryption_key:
-            if remuxed_path.suffix == ".webm":
-                self.decrypt_packager(
-                    key_id,
-                    decryption_key,
-                    encrypted_path_video,
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    self.download_stream,
+                    stream_info.segment_urls_video,
                     decrypted_path_video,
-                )
-                self.decrypt_packager(
                     key_id,
-                    decryption_key,
-                    encrypted_path_audio,
-                    decrypted_path_audio,
-                )
-            else:
-                self.decrypt_mp4decrypt(
                     decryption_key,
                     encrypted_path_video,
-                    decrypted_path_video,
-                )
-                self.decrypt_mp4decrypt(
+                ),
+                executor.submit(
+                    self.download_stream,
+                    stream_info.segment_urls_audio,
+                    decrypted_path_audio,
+                    key_id,
                     decryption_key,
                     encrypted_path_audio,
-                    decrypted_path_audio,
-                )
-        if self.remux_mode == RemuxModeAudio.MP4BOX:
+                ),
+            ]
+            for future in futures:
+                future.result()
+
+    def decrypt(
+        self,
+        key_id: str,
+        decryption_key: str,
+        encrypted_path: Path,
+        decrypted_path: Path,
+    ):
+        if decrypted_path.suffix == ".webm":
+            self.decrypt_packager(
+                key_id,
+                decryption_key,
+                encrypted_path,
+                decrypted_path,
+            )
+        else:
+            self.decrypt_mp4decrypt(
+                decryption_key,
+                encrypted_path,
+                decrypted_path,
+            )
+
+    def remux(
+        self,
+        decrypted_path_video: Path,
+        decrypted_path_audio: Path,
+        remuxed_path: Path,
+    ):
+        if self.remux_mode == RemuxModeVideo.MP4BOX:
             self.remux_mp4box(
                 decrypted_path_video,
                 decrypted_path_audio,
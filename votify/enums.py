@@ -1,7 +1,7 @@
 from enum import Enum
 
 
-class AudioQuality(Enum):
+class AudioQuality(str, Enum):
     VORBIS_HIGH = "vorbis-high"
     VORBIS_MEDIUM = "vorbis-medium"
     VORBIS_LOW = "vorbis-low"
@@ -9,29 +9,29 @@ class AudioQuality(Enum):
     AAC_HIGH = "aac-high"
 
 
-class VideoFormat(Enum):
+class VideoFormat(str, Enum):
     MP4 = "mp4"
     WEBM = "webm"
     ASK = "ask"
 
 
-class DownloadMode(Enum):
+class DownloadMode(str, Enum):
     YTDLP = "ytdlp"
     ARIA2C = "aria2c"
 
 
-class RemuxModeAudio(Enum):
+class RemuxModeAudio(str, Enum):
     FFMPEG = "ffmpeg"
     MP4BOX = "mp4box"
     MP4DECRYPT = "mp4decrypt"
 
 
-class RemuxModeVideo(Enum):
+class RemuxModeVideo(str, Enum):
     FFMPEG = "ffmpeg"
     MP4BOX = "mp4box"
 
 
-class CoverSize(Enum):
+class CoverSize(str, Enum):
     SMALL = "small"
     MEDIUM = "medium"
     LARGE = "large"
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+
+import orjson
+
+logger = logging.getLogger("votify")
+
+
+class MetadataCache:
+    def __init__(
+        self,
+        path: Path,
+        ttl: int = 86400,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.connection = None
+        try:
+            self._set_connection()
+            self._delete_expired()
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
+
+    def _set_connection(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "key TEXT PRIMARY KEY, "
+            "json BLOB NOT NULL, "
+            "inserted_at INTEGER NOT NULL"
+            ")"
+        )
+        self.connection.commit()
+
+    def _delete_expired(self):
+        self.connection.execute(
+            "DELETE FROM metadata WHERE inserted_at <= ?",
+            (int(time.time()) - self.ttl,),
+        )
+        self.connection.commit()
+
+    def _disable(self, error: Exception):
+        logger.warning(
+            f'Metadata cache at "{self.path}" is unavailable, disabling it: {error}'
+        )
+        self._close_connection()
+
+    def _close_connection(self):
+        if self.connection is None:
+            return
+        try:
+            self.connection.close()
+        except sqlite3.Error:
+            pass
+        self.connection = None
+
+    @staticmethod
+    def get_key_string(key: tuple) -> str:
+        return ":".join(key)
+
+    def get(self, key: tuple, default: typing.Any = None) -> typing.Any:
+        with self._lock:
+            if self.connection is None:
+                return default
+            try:
+                row = self.connection.execute(
+                    "SELECT json FROM metadata WHERE key = ? AND inserted_at > ?",
+                    (self.get_key_string(key), int(time.time()) - self.ttl),
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return default
+        if row is None:
+            return default
+        try:
+            return orjson.loads(row[0])
+        except orjson.JSONDecodeError:
+            return default
+
+    def set(self, key: tuple, value: typing.Any):
+        with self._lock:
+            if self.connection is None:
+                return
+            try:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?)",
+                    (self.get_key_string(key), orjson.dumps(value), int(time.time())),
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def close(self):
+        with self._lock:
+            self._close_connection()
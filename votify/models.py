@@ -1,23 +1,26 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 from .enums import AudioQuality
 
+DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_KWARGS)
 class Lyrics:
     synced: str = None
     unsynced: str = None
 
 
-@dataclass
+@dataclass(**DATACLASS_KWARGS)
 class UrlInfo:
     type: str = None
     id: str = None
 
 
-@dataclass
+@dataclass(**DATACLASS_KWARGS)
 class DownloadQueueItem:
     playlist_metadata: dict = None
     album_metadata: dict = None
@@ -25,7 +28,7 @@ class DownloadQueueItem:
     media_metadata: dict = None
 
 
-@dataclass
+@dataclass(**DATACLASS_KWARGS)
 class StreamInfoAudio:
     stream_url: str = None
     file_id: str = None
@@ -33,10 +36,18 @@ class StreamInfoAudio:
     quality: AudioQuality = None
 
 
-@dataclass
+@dataclass(**DATACLASS_KWARGS)
 class StreamInfoVideo:
     segment_urls_video: list[str] = None
     segment_urls_audio: list[str] = None
     file_type_video: str = None
     file_type_audio: str = None
     encryption_data_widevine: str = None
+
+
+@dataclass(**DATACLASS_KWARGS)
+class AlbumIndex:
+    tracks: dict[str, dict] = None
+    track_totals: dict[int, int] = None
+    disc_total: int = None
+    album_artist: str = None
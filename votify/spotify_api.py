@@ -1,24 +1,31 @@
 from __future__ import annotations
 
-import functools
-import json
 import re
+import threading
 import time
 import typing
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from http.cookiejar import CookieJar, MozillaCookieJar
 from pathlib import Path
 
-import base62
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .utils import check_response
 
+BASE62_CHARSET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+BASE62_CHARSET_INDEX = {char: index for index, char in enumerate(BASE62_CHARSET)}
+
 
 class SpotifyApi:
     SPOTIFY_HOME_PAGE_URL = "https://open.spotify.com/"
     CLIENT_VERSION = "1.2.46.25.g7f189073"
     LYRICS_API_URL = "https://spclient.wg.spotify.com/color-lyrics/v2/track/{track_id}"
     METADATA_API_URL = "https://api.spotify.com/v1/{type}/{item_id}"
+    METADATA_MULTIPLE_API_URL = "https://api.spotify.com/v1/{type}"
     GID_METADATA_API_URL = "https://spclient.wg.spotify.com/metadata/4/{media_type}/{gid}?market=from_token"
     PATHFINDER_API_URL = "https://api-partner.spotify.com/pathfinder/v1/query"
     VIDEO_MANIFEST_API_URL = "https://gue1-spclient.spotify.com/manifests/v7/json/sources/{gid}/options/supports_drm"
@@ -34,13 +41,33 @@ class SpotifyApi:
         "https://gue1-spclient.spotify.com/storage-resolve/v2/files/audio/interactive/11/"
         "{file_id}?version=10000000&product=9&platform=39&alt=json"
     )
+    NOW_PLAYING_VIEW_EXTENSIONS = orjson.dumps(
+        {
+            "persistedQuery": {
+                "version": 1,
+                "sha256Hash": "4ec4ae302c609a517cab6b8868f601cd3457c751c570ab12e988723cc036284f",
+            }
+        }
+    ).decode()
     EXTEND_TRACK_COLLECTION_WAIT_TIME = 0.5
+    EXTEND_MEDIA_COLLECTION_WORKERS = 4
+    MAX_ALBUMS_PER_REQUEST = 20
+    MAX_TRACKS_PER_REQUEST = 50
+    MAX_EPISODES_PER_REQUEST = 50
+    MAX_ARTIST_ALBUMS_PER_REQUEST = 50
+    HTTP_POOL_CONNECTIONS = 16
+    HTTP_POOL_MAXSIZE = 32
+    HTTP_MAX_RETRIES = 3
+    HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    LICENSE_RETRY_STATUS_CODES = (429,)
 
     def __init__(
         self,
         cookies: CookieJar = None,
     ):
         self.cookies = cookies
+        self._set_session_auth_lock()
+        self._set_cdn_session()
         self._set_session()
 
     @classmethod
@@ -49,8 +76,51 @@ class SpotifyApi:
         cookies.load(ignore_discard=True, ignore_expires=True)
         return cls(cookies)
 
+    def get_http_adapter(self) -> HTTPAdapter:
+        return HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=self.HTTP_MAX_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=self.HTTP_RETRY_STATUS_CODES,
+                raise_on_status=False,
+            ),
+        )
+
+    def get_license_http_adapter(self) -> HTTPAdapter:
+        return HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=self.HTTP_MAX_RETRIES,
+                read=0,
+                other=0,
+                backoff_factor=0.3,
+                status_forcelist=self.LICENSE_RETRY_STATUS_CODES,
+                allowed_methods={"POST"},
+                raise_on_status=False,
+            ),
+        )
+
+    def _set_session_auth_lock(self):
+        self._session_auth_lock = threading.Lock()
+
+    def _set_cdn_session(self):
+        self.cdn_session = requests.Session()
+        self.cdn_session.mount("https://", self.get_http_adapter())
+
     def _set_session(self):
         self.session = requests.Session()
+        self.session.mount("https://", self.get_http_adapter())
+        for license_api_url in (
+            self.PLAYPLAY_LICENSE_API_URL,
+            self.WIDEVINE_LICENSE_API_URL,
+        ):
+            self.session.mount(
+                license_api_url.split("{", 1)[0],
+                self.get_license_http_adapter(),
+            )
         if self.cookies is not None:
             self.session.cookies.update(self.cookies)
         self.session.headers.update(
@@ -76,13 +146,13 @@ class SpotifyApi:
 
     def _set_session_auth(self):
         home_page = self.get_home_page()
-        self.session_info = json.loads(
+        self.session_info = orjson.loads(
             re.search(
                 r'<script id="session" data-testid="session" type="application/json">(.+?)</script>',
                 home_page,
             ).group(1)
         )
-        self.config_info = json.loads(
+        self.config_info = orjson.loads(
             re.search(
                 r'<script id="config" data-testid="config" type="application/json">(.+?)</script>',
                 home_page,
@@ -94,14 +164,19 @@ class SpotifyApi:
             }
         )
 
-    def _refresh_session_auth(self):
+    def is_session_auth_expired(self) -> bool:
         timestamp_session_expire = int(
             self.session_info["accessTokenExpirationTimestampMs"]
         )
         timestamp_now = time.time() * 1000
-        if timestamp_now < timestamp_session_expire:
+        return timestamp_now >= timestamp_session_expire
+
+    def _refresh_session_auth(self):
+        if not self.is_session_auth_expired():
             return
-        self._set_session_auth()
+        with self._session_auth_lock:
+            if self.is_session_auth_expired():
+                self._set_session_auth()
 
     def get_home_page(self) -> str:
         response = self.session.get(
@@ -112,11 +187,19 @@ class SpotifyApi:
 
     @staticmethod
     def media_id_to_gid(media_id: str) -> str:
-        return hex(base62.decode(media_id, base62.CHARSET_INVERTED))[2:].zfill(32)
+        gid = 0
+        for char in media_id:
+            gid = gid * 62 + BASE62_CHARSET_INDEX[char]
+        return f"{gid:032x}"
 
     @staticmethod
     def gid_to_media_id(gid: str) -> str:
-        return base62.encode(int(gid, 16), charset=base62.CHARSET_INVERTED).zfill(22)
+        gid = int(gid, 16)
+        media_id = []
+        while gid:
+            gid, remainder = divmod(gid, 62)
+            media_id.append(BASE62_CHARSET[remainder])
+        return "".join(reversed(media_id)).zfill(22)
 
     def get_gid_metadata(
         self,
@@ -128,7 +211,7 @@ class SpotifyApi:
             self.GID_METADATA_API_URL.format(gid=gid, media_type=media_type)
         )
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_lyrics(self, track_id: str) -> dict | None:
         self._refresh_session_auth()
@@ -136,7 +219,7 @@ class SpotifyApi:
         if response.status_code == 404:
             return None
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_track(self, track_id: str) -> dict:
         self._refresh_session_auth()
@@ -144,21 +227,63 @@ class SpotifyApi:
             self.METADATA_API_URL.format(type="tracks", item_id=track_id)
         )
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)
+
+    def get_tracks(self, track_ids: list[str]) -> list[dict]:
+        self._refresh_session_auth()
+        response = self.session.get(
+            self.METADATA_MULTIPLE_API_URL.format(type="tracks"),
+            params={"ids": ",".join(track_ids)},
+        )
+        check_response(response)
+        return [track for track in orjson.loads(response.content)["tracks"] if track]
+
+    def get_media_collection_page(self, url: str) -> dict:
+        response = self.session.get(url)
+        check_response(response)
+        return orjson.loads(response.content)
+
+    def get_media_collection_page_urls(self, collection: dict) -> list[str]:
+        next_url = urllib.parse.urlsplit(collection["next"])
+        query = dict(urllib.parse.parse_qsl(next_url.query))
+        if "offset" not in query:
+            return []
+        page_urls = []
+        for offset in range(
+            int(query["offset"]),
+            collection["total"],
+            collection["limit"],
+        ):
+            query["offset"] = offset
+            page_urls.append(
+                next_url._replace(query=urllib.parse.urlencode(query)).geturl()
+            )
+        return page_urls
 
     def extended_media_collection(
         self,
-        next_url: str,
+        collection: dict,
     ) -> typing.Generator[dict, None, None]:
+        next_url = collection["next"]
+        if next_url is None:
+            return
+        page_urls = self.get_media_collection_page_urls(collection)
+        if page_urls:
+            with ThreadPoolExecutor(
+                max_workers=self.EXTEND_MEDIA_COLLECTION_WORKERS
+            ) as executor:
+                for extended_collection in executor.map(
+                    self.get_media_collection_page,
+                    page_urls,
+                ):
+                    yield extended_collection
+            next_url = extended_collection["next"]
         while next_url is not None:
-            response = self.session.get(next_url)
-            check_response(response)
-            extended_collection = response.json()
+            extended_collection = self.get_media_collection_page(next_url)
             yield extended_collection
             next_url = extended_collection["next"]
             time.sleep(self.EXTEND_TRACK_COLLECTION_WAIT_TIME)
 
-    @functools.lru_cache()
     def get_album(
         self,
         album_id: str,
@@ -169,19 +294,44 @@ class SpotifyApi:
             self.METADATA_API_URL.format(type="albums", item_id=album_id)
         )
         check_response(response)
-        album = response.json()
+        album = orjson.loads(response.content)
         if extend:
             album["tracks"]["items"].extend(
                 [
                     item
                     for extended_collection in self.extended_media_collection(
-                        album["tracks"]["next"],
+                        album["tracks"],
                     )
                     for item in extended_collection["items"]
                 ]
             )
         return album
 
+    def get_albums(
+        self,
+        album_ids: list[str],
+        extend: bool = True,
+    ) -> list[dict]:
+        self._refresh_session_auth()
+        response = self.session.get(
+            self.METADATA_MULTIPLE_API_URL.format(type="albums"),
+            params={"ids": ",".join(album_ids)},
+        )
+        check_response(response)
+        albums = [album for album in orjson.loads(response.content)["albums"] if album]
+        if extend:
+            for album in albums:
+                album["tracks"]["items"].extend(
+                    [
+                        item
+                        for extended_collection in self.extended_media_collection(
+                            album["tracks"],
+                        )
+                        for item in extended_collection["items"]
+                    ]
+                )
+        return albums
+
     def get_playlist(
         self,
         playlist_id: str,
@@ -192,13 +342,13 @@ class SpotifyApi:
             self.METADATA_API_URL.format(type="playlists", item_id=playlist_id)
         )
         check_response(response)
-        playlist = response.json()
+        playlist = orjson.loads(response.content)
         if extend:
             playlist["tracks"]["items"].extend(
                 [
                     item
                     for extended_collection in self.extended_media_collection(
-                        playlist["tracks"]["next"],
+                        playlist["tracks"],
                     )
                     for item in extended_collection["items"]
                 ]
@@ -211,7 +361,7 @@ class SpotifyApi:
             self.TRACK_CREDITS_API_URL.format(track_id=track_id)
         )
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_episode(self, episode_id: str) -> dict:
         self._refresh_session_auth()
@@ -219,7 +369,18 @@ class SpotifyApi:
             self.METADATA_API_URL.format(type="episodes", item_id=episode_id)
         )
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)
+
+    def get_episodes(self, episode_ids: list[str]) -> list[dict]:
+        self._refresh_session_auth()
+        response = self.session.get(
+            self.METADATA_MULTIPLE_API_URL.format(type="episodes"),
+            params={"ids": ",".join(episode_ids)},
+        )
+        check_response(response)
+        return [
+            episode for episode in orjson.loads(response.content)["episodes"] if episode
+        ]
 
     def get_show(self, show_id: str, extend: bool = True) -> dict:
         self._refresh_session_auth()
@@ -227,13 +388,13 @@ class SpotifyApi:
             self.METADATA_API_URL.format(type="shows", item_id=show_id)
         )
         check_response(response)
-        show = response.json()
+        show = orjson.loads(response.content)
         if extend:
             show["episodes"]["items"].extend(
                 [
                     item
                     for extended_collection in self.extended_media_collection(
-                        show["episodes"]["next"],
+                        show["episodes"],
                     )
                     for item in extended_collection["items"]
                 ]
@@ -247,16 +408,17 @@ class SpotifyApi:
     ) -> dict:
         self._refresh_session_auth()
         response = self.session.get(
-            self.METADATA_API_URL.format(type="artists", item_id=artist_id) + "/albums"
+            self.METADATA_API_URL.format(type="artists", item_id=artist_id) + "/albums",
+            params={"limit": self.MAX_ARTIST_ALBUMS_PER_REQUEST},
         )
         check_response(response)
-        artist_albums = response.json()
+        artist_albums = orjson.loads(response.content)
         if extend:
             artist_albums["items"].extend(
                 [
                     item
                     for extended_collection in self.extended_media_collection(
-                        artist_albums["next"],
+                        artist_albums,
                     )
                     for item in extended_collection["items"]
                 ]
@@ -270,12 +432,11 @@ class SpotifyApi:
         self._refresh_session_auth()
         response = self.session.get(self.VIDEO_MANIFEST_API_URL.format(gid=gid))
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_seek_table(self, file_id: str) -> dict:
         headers = {
             "Accept": "*/*",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
             "Accept-Language": "en-US",
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
@@ -288,12 +449,12 @@ class SpotifyApi:
             "Sec-Fetch-Site": "cross-site",
             "User-Agent": self.session.headers["user-agent"],
         }
-        response = requests.get(
+        response = self.cdn_session.get(
             self.SEEK_TABLE_API_URL.format(file_id=file_id),
             headers=headers,
         )
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_playplay_license(self, file_id: str, challenge: bytes) -> bytes:
         self._refresh_session_auth()
@@ -317,7 +478,7 @@ class SpotifyApi:
         self._refresh_session_auth()
         response = self.session.get(self.STREAM_URLS_API_URL.format(file_id=file_id))
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_now_playing_view(self, track_id: str, artist_id: str) -> dict:
         self._refresh_session_auth()
@@ -325,23 +486,16 @@ class SpotifyApi:
             self.PATHFINDER_API_URL,
             params={
                 "operationName": "queryNpvArtist",
-                "variables": json.dumps(
+                "variables": orjson.dumps(
                     {
                         "artistUri": f"spotify:artist:{artist_id}",
                         "trackUri": f"spotify:track:{track_id}",
                         "enableCredits": True,
                         "enableRelatedVideos": True,
                     }
-                ),
-                "extensions": json.dumps(
-                    {
-                        "persistedQuery": {
-                            "version": 1,
-                            "sha256Hash": "4ec4ae302c609a517cab6b8868f601cd3457c751c570ab12e988723cc036284f",
-                        }
-                    }
-                ),
+                ).decode(),
+                "extensions": self.NOW_PLAYING_VIEW_EXTENSIONS,
             },
         )
         check_response(response)
-        return response.json()
+        return orjson.loads(response.content)